@@ -7,12 +7,15 @@ loop follows the official OpenAI guidelines:
     1.  Send the user prompt together with the tool definitions.
     2.  If the model responds with ``function_call`` output items,
         execute the matching tool and append a ``function_call_output``.
-    3.  Send the updated input list back to the model.
+    3.  Send only the new ``function_call_output`` items back to the
+        model, chained to the previous turn with ``previous_response_id``.
     4.  Repeat until the model produces a text response.
 """
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
 from openai import AuthenticationError, OpenAI, RateLimitError
@@ -20,24 +23,36 @@ from openai import AuthenticationError, OpenAI, RateLimitError
 from config import OPENAI_API_KEY, OPENAI_MODEL, validate_openai_credentials
 from tools import TOOL_REGISTRY
 
+# The registry is fixed at import time, so the lookup and the schemas sent
+# to the API are built once and shared by every agent instance.
+_TOOLS_BY_NAME: dict[str, Any] = {tool.name: tool for tool in TOOL_REGISTRY}
+_TOOL_SCHEMAS: list[dict] = [tool.schema for tool in TOOL_REGISTRY]
+
+# Upper bound on tool calls executed concurrently within one model turn
+_MAX_TOOL_WORKERS = 8
+
+
+@lru_cache(maxsize=1)
+def _shared_client() -> OpenAI:
+    """Return the process-wide OpenAI client, created on first use.
+
+    Sharing one client means every agent reuses the same HTTP connection
+    pool instead of opening fresh TLS connections.
+    """
+    return OpenAI(api_key=OPENAI_API_KEY)
+
 
 class ContentAgent:
     """Thin wrapper around the OpenAI Responses API with tool support."""
 
     def __init__(self) -> None:
         validate_openai_credentials()
-        self._client = OpenAI(api_key=OPENAI_API_KEY)
+        self._client = _shared_client()
         self._model = OPENAI_MODEL
 
-        # Build a name → tool lookup from the registry
-        self._tools_by_name: dict[str, Any] = {
-            tool.name: tool for tool in TOOL_REGISTRY
-        }
-
-        # Schemas sent to the API
-        self._tool_schemas: list[dict] = [
-            tool.schema for tool in TOOL_REGISTRY
-        ]
+        # Name → tool lookup and the schemas sent to the API
+        self._tools_by_name: dict[str, Any] = _TOOLS_BY_NAME
+        self._tool_schemas: list[dict] = _TOOL_SCHEMAS
 
     # ------------------------------------------------------------------
     # Public API
@@ -59,9 +74,12 @@ class ContentAgent:
             The model's final text output after all tool calls have been
             resolved.
         """
-        input_list: list[dict] = [
+        # Only the items that are new this turn are sent; earlier context is
+        # referenced server-side through ``previous_response_id``.
+        input_list: list[Any] = [
             {"role": "user", "content": user_prompt},
         ]
+        previous_response_id: str | None = None
 
         while True:
             print(
@@ -75,6 +93,7 @@ class ContentAgent:
                     instructions=instructions,
                     tools=self._tool_schemas,
                     input=input_list,
+                    previous_response_id=previous_response_id,
                 )
             except AuthenticationError:
                 return "Error: Invalid API key. Check your .env file."
@@ -86,8 +105,8 @@ class ContentAgent:
             except Exception as exc:
                 return f"Error: An unexpected error occurred: {exc}"
 
-            # Append the model's output items to the running input
-            input_list += response.output
+            previous_response_id = response.id
+            input_list = []
 
             # Check if the model made any function calls
             function_calls = [
@@ -99,32 +118,22 @@ class ContentAgent:
                 # No more tool calls – return the final text
                 return response.output_text
 
-            # Execute each tool and append results
-            for i, call in enumerate(function_calls, 1):
-                tool = self._tools_by_name.get(call.name)
-                if tool is None:
-                    print(
-                        f"  ⚠ Unknown tool: {call.name}",
-                        file=sys.stderr,
-                        flush=True,
-                    )
-                    result = json.dumps(
-                        {"error": f"Unknown tool: {call.name}"}
-                    )
-                else:
-                    print(
-                        f"  🔧 [{i}/{len(function_calls)}] Running {call.name}...",
-                        file=sys.stderr,
-                        flush=True,
-                    )
-                    args = json.loads(call.arguments)
-                    result = tool.execute(**args)
-                    print(
-                        f"  ✅ {call.name} done.",
-                        file=sys.stderr,
-                        flush=True,
+            # Execute the tools concurrently (they are mostly I/O-bound)
+            # and append the results in the original call order
+            total = len(function_calls)
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_TOOL_WORKERS, total)
+            ) as pool:
+                results = list(
+                    pool.map(
+                        self._execute_call,
+                        function_calls,
+                        range(1, total + 1),
+                        [total] * total,
                     )
+                )
 
+            for call, result in zip(function_calls, results):
                 input_list.append(
                     {
                         "type": "function_call_output",
@@ -133,6 +142,35 @@ class ContentAgent:
                     }
                 )
 
+    # ------------------------------------------------------------------
+    # Tool execution
+    # ------------------------------------------------------------------
+
+    def _execute_call(self, call: Any, index: int, total: int) -> str:
+        """Run the tool requested by a ``function_call`` item."""
+        tool = self._tools_by_name.get(call.name)
+        if tool is None:
+            print(
+                f"  ⚠ Unknown tool: {call.name}",
+                file=sys.stderr,
+                flush=True,
+            )
+            return json.dumps({"error": f"Unknown tool: {call.name}"})
+
+        print(
+            f"  🔧 [{index}/{total}] Running {call.name}...",
+            file=sys.stderr,
+            flush=True,
+        )
+        args = json.loads(call.arguments)
+        result = tool.execute(**args)
+        print(
+            f"  ✅ {call.name} done.",
+            file=sys.stderr,
+            flush=True,
+        )
+        return result
+
     # ------------------------------------------------------------------
     # Summarization (no tools)
     # ------------------------------------------------------------------
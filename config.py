@@ -2,10 +2,22 @@
 
 import os
 import sys
+from functools import lru_cache
+from typing import Any
 
 from dotenv import load_dotenv
 
-load_dotenv()
+try:
+    import ahocorasick
+except ImportError:  # optional C extension; substring checks are used
+    ahocorasick = None
+
+# Every variable read below; when the environment already provides all of
+# them (CI, containers, cron with exported vars) ``.env`` would not change
+# anything, so the file lookup and parse are skipped.
+_ENV_VARS = ("GOOGLE_API_KEY", "GOOGLE_CSE_ID", "OPENAI_API_KEY", "OPENAI_MODEL")
+if not all(os.getenv(name) for name in _ENV_VARS):
+    load_dotenv()
 
 # ---------------------------------------------------------------------------
 # Google API
@@ -19,6 +31,16 @@ GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID", "")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 
+# ---------------------------------------------------------------------------
+# HTTP response cache (feeds and scraped pages, persisted across runs)
+# ---------------------------------------------------------------------------
+# Anchored to the project directory so the cache does not depend on the
+# working directory the monitor is started from.
+HTTP_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".http_cache.sqlite"
+)
+HTTP_CACHE_EXPIRE = 900  # seconds; expired entries are revalidated via ETag
+
 # ---------------------------------------------------------------------------
 # RSS feeds from Latin American media (cleaned and validated)
 # ---------------------------------------------------------------------------
@@ -243,6 +265,33 @@ GOOGLE_SEARCH_KEYWORDS = [
 ]
 
 
+# ---------------------------------------------------------------------------
+# Keyword matchers (built once at import, one linear scan per text)
+# ---------------------------------------------------------------------------
+# ``(keyword, keyword.lower())`` pairs, lower-cased once instead of per call
+_REGION_LC = tuple((kw, kw.lower()) for kw in REGION_KEYWORDS)
+_PRIMARY_LC = tuple((kw, kw.lower()) for kw in PRIMARY_KEYWORDS)
+_SECONDARY_LC = tuple((kw, kw.lower()) for kw in SECONDARY_KEYWORDS)
+
+
+def _build_automaton() -> Any:
+    """Build one Aho-Corasick automaton over every keyword bucket.
+
+    Each lower-cased keyword maps to itself; which bucket(s) it belongs
+    to is resolved afterwards from the ``_*_LC`` tables, so a keyword
+    listed in several buckets is still only stored once.
+    """
+    automaton = ahocorasick.Automaton()
+    for keywords in (_REGION_LC, _PRIMARY_LC, _SECONDARY_LC):
+        for _, lc in keywords:
+            automaton.add_word(lc, lc)
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton() if ahocorasick is not None else None
+
+
 def matches_keywords(text: str) -> tuple[bool, list[str]]:
     """Check whether *text* passes the mandatory keyword filters.
 
@@ -253,21 +302,43 @@ def matches_keywords(text: str) -> tuple[bool, list[str]]:
     2.  At least one **PRIMARY** or **SECONDARY** keyword is also found.
 
     This is the single source of truth for keyword filtering, used by
-    every tool so the logic stays consistent.
+    every tool so the logic stays consistent.  Results are memoised per
+    text, since the same snippets recur across searches and pages.
+    """
+    return matches_keywords_lower(text.lower())
+
+
+def matches_keywords_lower(text_lower: str) -> tuple[bool, list[str]]:
+    """Same as :func:`matches_keywords` for text that is already lowercased.
+
+    Lets callers that build the text anyway fold the case in the same
+    step instead of paying for a second copy inside the matcher.
     """
-    text_lower = text.lower()
+    passes, matched = _match_lower(text_lower)
+    return passes, list(matched)
+
+
+@lru_cache(maxsize=4096)
+def _match_lower(text_lower: str) -> tuple[bool, tuple[str, ...]]:
+    """Cached implementation of :func:`matches_keywords_lower`."""
+    # With the automaton, a single pass collects every keyword in the
+    # text.  Without it, ``lc in found`` below is a plain substring check
+    # against the text itself (faster in CPython than a regex alternation).
+    found: Any = text_lower
+    if _AUTOMATON is not None:
+        found = {value for _, value in _AUTOMATON.iter(text_lower)}
 
-    region_hits = [kw for kw in REGION_KEYWORDS if kw.lower() in text_lower]
+    region_hits = [kw for kw, lc in _REGION_LC if lc in found]
     if not region_hits:
-        return False, []
+        return False, ()
 
-    primary_hits = [kw for kw in PRIMARY_KEYWORDS if kw.lower() in text_lower]
-    secondary_hits = [kw for kw in SECONDARY_KEYWORDS if kw.lower() in text_lower]
+    primary_hits = [kw for kw, lc in _PRIMARY_LC if lc in found]
+    secondary_hits = [kw for kw, lc in _SECONDARY_LC if lc in found]
 
     if not primary_hits and not secondary_hits:
-        return False, []
+        return False, ()
 
-    return True, primary_hits + secondary_hits + region_hits
+    return True, (*primary_hits, *secondary_hits, *region_hits)
 
 
 def validate_google_credentials() -> None:
@@ -1,22 +1,24 @@
 """Content Monitor -- entry point.
 
 Deterministically executes all three data-collection tools (RSS feeds,
-Google search, web scraping), writes the combined results to a CSV file,
-then sends the CSV content to the OpenAI model for summarization.
+Google search, web scraping) concurrently, writes the combined results to
+a CSV file, then sends the CSV content to the OpenAI model for
+summarization.
 """
 
 import csv
 import io
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import NamedTuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import orjson
 
 from agent import ContentAgent
 from config import (
     GOOGLE_SEARCH_KEYWORDS,
-    PRIMARY_KEYWORDS,
-    REGION_KEYWORDS,
-    SECONDARY_KEYWORDS,
     validate_google_credentials,
     validate_openai_credentials,
 )
@@ -25,18 +27,32 @@ from tools.google_search import GoogleSearchTool
 from tools.web_scraper import WebScraperTool
 
 # ------------------------------------------------------------------
-# CSV output path
+# CSV output path and row layout
 # ------------------------------------------------------------------
 CSV_PATH = "monitor_results.csv"
-CSV_COLUMNS = [
-    "date",
-    "url",
-    "title",
-    "summary",
-    "source",
-    "matched_keywords",
-    "tool",
-]
+
+
+class Row(NamedTuple):
+    """One collected entry; field order is the CSV column order."""
+
+    date: str
+    url: str
+    title: str
+    summary: str
+    source: str
+    matched_keywords: str
+    tool: str
+
+
+CSV_COLUMNS = list(Row._fields)
+
+# Concurrent Google Custom Search queries (CSE quotas are per minute, so
+# a burst covering every configured keyword is fine)
+GOOGLE_MAX_WORKERS = 8
+
+# Query parameters that only track the visitor and never change the page
+_TRACKING_PARAM_PREFIXES = ("utm_",)
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "igshid", "mc_cid", "mc_eid"})
 
 # ------------------------------------------------------------------
 # System-level instructions sent to the model for summarization
@@ -46,23 +62,22 @@ You are an anti-piracy content monitoring assistant.
 
 You will receive the contents of a CSV file with articles collected from
 RSS feeds, Google searches, and scraped web pages.  Every article has
-already been pre-filtered through keyword and region filters.
-Apply a second pass: discard any article that is NOT relevant to the
-keyword and region criteria listed below.
-
-REGION keywords (article MUST mention at least one):
-  {region_keywords}
+already been pre-filtered through keyword and region filters, and the
+"matched_keywords" column lists the REGION, PRIMARY and SECONDARY
+keywords that were found in it.  Example row:
 
-PRIMARY keywords (preferred):
-  {primary_keywords}
+  2025-10-14,https://example.com/nota,Operativo contra la piratería en \
+México,...,https://example.com/rss,"operativo, contra la, México",read_feeds
 
-SECONDARY keywords (supporting):
-  {secondary_keywords}
+Apply a second pass using "matched_keywords" as the evidence for each
+row: discard any article that is NOT actually about piracy or
+anti-piracy in a Latin-American region.
 
 Your job is to:
   1.  Remove duplicate articles (same URL or same headline).
-  2.  Discard any article whose title and summary do not mention at least
-      one REGION keyword.
+  2.  Discard any article whose title and summary do not really refer to
+      the region listed in its "matched_keywords" (e.g. a keyword that
+      only appears as part of an unrelated word or name).
   3.  Return a **numbered list** of the remaining articles with:
       - Title
       - URL
@@ -74,20 +89,11 @@ Your job is to:
 """
 
 
-def _build_summary_instructions() -> str:
-    """Build the summarization prompt with the configured keyword lists."""
-    return SUMMARY_INSTRUCTIONS.format(
-        region_keywords=", ".join(REGION_KEYWORDS),
-        primary_keywords=", ".join(PRIMARY_KEYWORDS),
-        secondary_keywords=", ".join(SECONDARY_KEYWORDS),
-    )
-
-
 # ------------------------------------------------------------------
 # Data collection
 # ------------------------------------------------------------------
 
-def _collect_feeds() -> list[dict]:
+def _collect_feeds() -> list[Row]:
     """Run the feed reader and normalise results."""
     print(
         "\n\U0001f4e1 Step 1/3: Reading RSS feeds...",
@@ -95,21 +101,21 @@ def _collect_feeds() -> list[dict]:
         flush=True,
     )
     tool = FeedReaderTool()
-    raw = json.loads(tool.execute())
-    rows: list[dict] = []
+    raw = orjson.loads(tool.execute())
+    rows: list[Row] = []
     for item in raw:
         rows.append(
-            {
-                "date": item.get("date", ""),
-                "url": item.get("url", ""),
-                "title": item.get("title", ""),
-                "summary": item.get("summary", ""),
-                "source": item.get("source", ""),
-                "matched_keywords": ", ".join(
+            Row(
+                date=item.get("date", ""),
+                url=item.get("url", ""),
+                title=item.get("title", ""),
+                summary=item.get("summary", ""),
+                source=item.get("source", ""),
+                matched_keywords=", ".join(
                     item.get("matched_keywords", [])
                 ),
-                "tool": "read_feeds",
-            }
+                tool="read_feeds",
+            )
         )
     print(
         f"  \u2705 {len(rows)} articles from feeds",
@@ -119,7 +125,7 @@ def _collect_feeds() -> list[dict]:
     return rows
 
 
-def _collect_google() -> list[dict]:
+def _collect_google() -> list[Row]:
     """Run Google searches for every configured keyword."""
     print(
         "\n\U0001f50d Step 2/3: Running Google searches...",
@@ -127,9 +133,20 @@ def _collect_google() -> list[dict]:
         flush=True,
     )
     tool = GoogleSearchTool()
-    rows: list[dict] = []
-    for keyword in GOOGLE_SEARCH_KEYWORDS:
-        raw = json.loads(tool.execute(query=keyword))
+    rows: list[Row] = []
+
+    # Queries are independent round-trips; run a few at a time and keep
+    # the results in keyword order.
+    workers = max(1, min(GOOGLE_MAX_WORKERS, len(GOOGLE_SEARCH_KEYWORDS)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        responses = list(
+            pool.map(
+                lambda kw: tool.execute(query=kw), GOOGLE_SEARCH_KEYWORDS
+            )
+        )
+
+    for keyword, response in zip(GOOGLE_SEARCH_KEYWORDS, responses):
+        raw = orjson.loads(response)
         if isinstance(raw, dict) and "error" in raw:
             print(
                 f"  \u26a0 Error for '{keyword}': {raw['error']}",
@@ -139,17 +156,17 @@ def _collect_google() -> list[dict]:
             continue
         for item in raw:
             rows.append(
-                {
-                    "date": "",
-                    "url": item.get("link", ""),
-                    "title": item.get("title", ""),
-                    "summary": item.get("snippet", ""),
-                    "source": "Google Search",
-                    "matched_keywords": ", ".join(
+                Row(
+                    date="",
+                    url=item.get("link", ""),
+                    title=item.get("title", ""),
+                    summary=item.get("snippet", ""),
+                    source="Google Search",
+                    matched_keywords=", ".join(
                         item.get("matched_keywords", [])
                     ),
-                    "tool": "google_search",
-                }
+                    tool="google_search",
+                )
             )
     print(
         f"  \u2705 {len(rows)} results from Google",
@@ -159,7 +176,7 @@ def _collect_google() -> list[dict]:
     return rows
 
 
-def _collect_scrapes() -> list[dict]:
+def _collect_scrapes() -> list[Row]:
     """Run the web scraper on the default page list."""
     print(
         "\n\U0001f310 Step 3/3: Scraping web pages...",
@@ -167,24 +184,24 @@ def _collect_scrapes() -> list[dict]:
         flush=True,
     )
     tool = WebScraperTool()
-    raw = json.loads(tool.execute())
+    raw = orjson.loads(tool.execute())
     results = raw.get("results", [])
     skipped = raw.get("skipped", [])
 
-    rows: list[dict] = []
+    rows: list[Row] = []
     for item in results:
         rows.append(
-            {
-                "date": "",
-                "url": item.get("url", ""),
-                "title": "",
-                "summary": item.get("text", ""),
-                "source": item.get("source_page", ""),
-                "matched_keywords": ", ".join(
+            Row(
+                date="",
+                url=item.get("url", ""),
+                title="",
+                summary=item.get("text", ""),
+                source=item.get("source_page", ""),
+                matched_keywords=", ".join(
                     item.get("matched_keywords", [])
                 ),
-                "tool": "scrape_pages",
-            }
+                tool="scrape_pages",
+            )
         )
 
     if skipped:
@@ -208,33 +225,69 @@ def _collect_scrapes() -> list[dict]:
 # CSV helpers
 # ------------------------------------------------------------------
 
-def _write_csv(rows: list[dict], path: str) -> None:
-    """Write *rows* to a CSV file at *path*."""
-    with open(path, "w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
-        writer.writerows(rows)
+def _rows_to_csv(rows: list[Row]) -> str:
+    """Serialise *rows* to CSV text (header included)."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(CSV_COLUMNS)
+    writer.writerows(rows)
+    return buf.getvalue()
 
 
-def _read_csv_as_text(path: str) -> str:
-    """Read the CSV file at *path* and return it as a string."""
-    with open(path, "r", encoding="utf-8") as fh:
-        return fh.read()
+def _write_csv(csv_text: str, path: str) -> None:
+    """Write already-serialised *csv_text* to a CSV file at *path*."""
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        fh.write(csv_text)
 
 
 # ------------------------------------------------------------------
 # De-duplicate by URL before writing
 # ------------------------------------------------------------------
 
-def _deduplicate(rows: list[dict]) -> list[dict]:
-    """Remove entries with duplicate URLs, keeping the first occurrence."""
-    seen: set[str] = set()
-    unique: list[dict] = []
+def _normalize_url(url: str) -> str:
+    """Return the canonical form of *url* used as the de-duplication key.
+
+    Lower-cases the scheme and host, drops tracking query parameters and
+    the fragment, and strips a trailing slash from the path.  URLs that
+    cannot be parsed (e.g. a malformed IPv6 host) are keyed as written.
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(_TRACKING_PARAM_PREFIXES)
+        and key.lower() not in _TRACKING_PARAMS
+    ]
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/"),
+            urlencode(query),
+            "",
+        )
+    )
+
+
+def _deduplicate(rows: list[Row], seen: set[str] | None = None) -> list[Row]:
+    """Remove entries with duplicate URLs, keeping the first occurrence.
+
+    URLs are compared in normalized form, so tracking parameters or a
+    trailing slash do not produce duplicates.  Pass the same *seen* set
+    across calls to de-duplicate incrementally.
+    """
+    if seen is None:
+        seen = set()
+    unique: list[Row] = []
     for row in rows:
-        url = row.get("url", "")
-        if url and url in seen:
+        key = _normalize_url(row.url) if row.url else ""
+        if key and key in seen:
             continue
-        seen.add(url)
+        seen.add(key)
         unique.append(row)
     return unique
 
@@ -247,28 +300,40 @@ def main() -> None:
     validate_google_credentials()
     validate_openai_credentials()
 
-    # 1. Collect data deterministically from all three sources
-    all_rows: list[dict] = []
-    all_rows.extend(_collect_feeds())
-    all_rows.extend(_collect_google())
-    all_rows.extend(_collect_scrapes())
+    # 1. Collect data from all three sources concurrently (they are
+    #    independent and network-bound), then drop duplicate URLs in
+    #    source order so the output stays deterministic
+    collectors = (_collect_feeds, _collect_google, _collect_scrapes)
+    with ThreadPoolExecutor(max_workers=len(collectors)) as pool:
+        futures = [pool.submit(collect) for collect in collectors]
+
+    seen_urls: set[str] = set()
+    unique_rows: list[Row] = []
+    total_rows = 0
+    for future in futures:
+        rows = future.result()
+        total_rows += len(rows)
+        unique_rows.extend(_deduplicate(rows, seen_urls))
+
+    # 2. Serialise to CSV once; the file is written in the background
+    #    while the same text is sent to the model (step 3)
+    csv_text = _rows_to_csv(unique_rows)
+    with ThreadPoolExecutor(max_workers=1) as writer_pool:
+        write_future = writer_pool.submit(_write_csv, csv_text, CSV_PATH)
+
+        # 3. Send CSV content to the model for summarization
+        agent = ContentAgent()
+        answer = agent.summarize(csv_text, instructions=SUMMARY_INSTRUCTIONS)
+
+        write_future.result()
 
-    # 2. De-duplicate and write to CSV
-    unique_rows = _deduplicate(all_rows)
-    _write_csv(unique_rows, CSV_PATH)
     print(
         f"\n\U0001f4be {len(unique_rows)} unique entries written to {CSV_PATH}"
-        f" ({len(all_rows) - len(unique_rows)} duplicates removed)",
+        f" ({total_rows - len(unique_rows)} duplicates removed)",
         file=sys.stderr,
         flush=True,
     )
 
-    # 3. Send CSV content to the model for summarization
-    csv_text = _read_csv_as_text(CSV_PATH)
-    instructions = _build_summary_instructions()
-    agent = ContentAgent()
-    answer = agent.summarize(csv_text, instructions=instructions)
-
     print(answer)
 
 
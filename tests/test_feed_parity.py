@@ -0,0 +1,126 @@
+"""The lxml fast path must return the same entries as feedparser.
+
+Parity covers the feeds the fast path accepts.  Feeds with inline markup
+are handed to feedparser instead, and a few dates feedparser rejects are
+parsed by the fast path; both are pinned below as known differences.
+"""
+
+import pytest
+
+from tools.feed_reader import FeedReaderTool
+
+FEED_URL = "http://host.example/feeds/rss"
+
+RSS = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>Noticias</title>
+    <link>http://host.example/</link>
+    <item>
+      <title>Operativo contra la pirater\xc3\xada</title>
+      <link>/news/1</link>
+      <description>Resumen de la nota</description>
+      <pubDate>Tue, 14 Oct 2025 23:30:00 -0500</pubDate>
+    </item>
+    <item>
+      <title>Fecha ISO en pubDate</title>
+      <link>relative/2</link>
+      <description>Otra nota</description>
+      <pubDate>2025-10-14T10:00:00+02:00</pubDate>
+    </item>
+    <item>
+      <title>Enlace por guid</title>
+      <guid>http://host.example/news/3</guid>
+      <content:encoded>Solo contenido</content:encoded>
+      <dc:date>2025-10-13T08:00:00Z</dc:date>
+    </item>
+    <item>
+      <title>Host malformado</title>
+      <link>http://[bad/</link>
+      <description>Enlace que no se puede resolver</description>
+    </item>
+    <item>
+      <title>Enlace vac\xc3\xado junto a guid</title>
+      <link></link>
+      <guid>http://host.example/news/4</guid>
+      <description>El guid no sustituye a un link presente</description>
+    </item>
+    <item>
+      <title>Sin fecha</title>
+      <link>http://other.example/abs</link>
+      <description>Nota absoluta</description>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xml:base="http://base.example/dir/">
+  <title>Atom</title>
+  <entry>
+    <title>Relativo a xml:base</title>
+    <link href="post/1"/>
+    <summary>Resumen</summary>
+    <published>2025-10-14T22:00:00-05:00</published>
+  </entry>
+  <entry xml:base="sub/">
+    <title>xml:base anidado</title>
+    <link rel="alternate" href="post/2"/>
+    <content>Contenido</content>
+    <updated>2025-10-12T12:00:00Z</updated>
+  </entry>
+</feed>
+"""
+
+
+class _Response:
+    """The parts of ``requests.Response`` the parsers read."""
+
+    url = FEED_URL
+    headers = {"Content-Type": "application/xml; charset=utf-8"}
+
+
+@pytest.mark.parametrize("content", [RSS, ATOM], ids=["rss", "atom"])
+def test_lxml_matches_feedparser(content: bytes) -> None:
+    tool = FeedReaderTool()
+    fast = tool._parse_with_lxml(content, FEED_URL)
+    slow = tool._parse_with_feedparser(content, _Response())
+
+    assert fast is not None
+    assert fast == slow
+
+
+def _rss(item: str) -> bytes:
+    return (
+        '<rss version="2.0"><channel><title>t</title>'
+        f"<item>{item}</item></channel></rss>"
+    ).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        "<title>a <b>bold</b> c</title><link>/n</link>",
+        "<title>t</title><description>x <i>y</i></description>",
+    ],
+    ids=["title", "description"],
+)
+def test_inline_markup_falls_back_to_feedparser(item: str) -> None:
+    assert FeedReaderTool()._parse_with_lxml(_rss(item), FEED_URL) is None
+
+
+# Known differences: feedparser rejects these dates, the fast path keeps them.
+@pytest.mark.parametrize(
+    "pub_date",
+    ["Tue, 14 Oct 2025 23:30:00", "Martes, 14 Oct 2025 23:30:00 GMT"],
+    ids=["no-timezone", "spanish-weekday"],
+)
+def test_known_date_differences(pub_date: str) -> None:
+    content = _rss(f"<title>t</title><link>/n</link><pubDate>{pub_date}</pubDate>")
+    tool = FeedReaderTool()
+    (fast,) = tool._parse_with_lxml(content, FEED_URL)
+    (slow,) = tool._parse_with_feedparser(content, _Response())
+
+    assert fast["date"] == "2025-10-14"
+    assert slow["date"] == ""
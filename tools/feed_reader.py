@@ -1,16 +1,46 @@
 """RSS / Atom feed reader tool for the OpenAI agent."""
 
-import json
+import io
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 
 import feedparser
+import orjson
 import requests
+from lxml import etree
 
-from config import RSS_FEEDS, matches_keywords
+from config import RSS_FEEDS, matches_keywords_lower
 from tools.base import BaseTool
+from tools.session import SESSION
+
+try:
+    from feedparser.datetimes import _parse_date as _feedparser_parse_date
+except ImportError:  # private helper; the lenient date fallback is skipped
+    _feedparser_parse_date = None
+
+_REQUEST_TIMEOUT = 15  # seconds
+
+# Feeds are fetched concurrently; each one is a blocking network round-trip.
+_MAX_WORKERS = 16
+
+# Feed bodies are streamed in chunks and abandoned past this size
+_MAX_FEED_BYTES = 10 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+# XML names used by the lxml fast path
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_RSS_CONTENT = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
+
+def _parse_iso8601(value: str) -> datetime:
+    """Parse an ISO 8601 / RFC 3339 timestamp (``Z`` suffix included)."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
 class FeedReaderTool(BaseTool):
@@ -68,57 +98,283 @@ class FeedReaderTool(BaseTool):
         except Exception:
             return False
 
-    def _is_feed_accessible(self, feed_url: str, timeout: int = 10) -> bool:
-        """Return ``True`` if the feed responds with HTTP 200."""
-        try:
-            headers = {"User-Agent": self._USER_AGENT}
-            resp = requests.get(feed_url, timeout=timeout, headers=headers)
-            return resp.status_code == 200
-        except Exception:
-            return False
-
     @staticmethod
     def _extract_date(entry: Any) -> str:
         """Best-effort extraction of a publication date string."""
         try:
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                return datetime(*entry.published_parsed[:6]).strftime("%Y-%m-%d")
-            if hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                return datetime(*entry.updated_parsed[:6]).strftime("%Y-%m-%d")
+            parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+            if parsed:
+                return time.strftime("%Y-%m-%d", parsed)
         except Exception:
             pass
         return ""
 
-    def _parse_feed(self, feed_url: str) -> list[dict]:
-        """Parse a single feed and return a list of article dicts."""
-        articles: list[dict] = []
+    # ------------------------------------------------------------------
+    # Helpers — lxml fast path (RSS 2.0 / Atom)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _xml_text(element: Any) -> str:
+        """Return the stripped text of *element* ('' when missing)."""
+        if element is None:
+            return ""
+        return "".join(element.itertext()).strip()
+
+    @staticmethod
+    def _format_date(value: str, rfc822: bool) -> str:
+        """Format a feed date as ``YYYY-MM-DD`` in UTC.
+
+        The format the spec calls for (RFC 822 for RSS, ISO 8601 for Atom)
+        is tried first, then the other one, then feedparser's own lenient
+        parsers, so mislabelled dates come out as on the feedparser path.
+        Matches feedparser, which normalises parsed dates to UTC.
+        """
+        if not value:
+            return ""
+        parsers = (parsedate_to_datetime, _parse_iso8601)
+        if not rfc822:
+            parsers = parsers[::-1]
+        for parse in parsers:
+            try:
+                parsed = parse(value)
+            except (TypeError, ValueError, IndexError):
+                continue
+            if parsed.tzinfo is not None:
+                parsed = parsed.astimezone(timezone.utc)
+            return parsed.strftime("%Y-%m-%d")
+
+        if _feedparser_parse_date is None:
+            return ""
+        fallback = _feedparser_parse_date(value)  # UTC struct_time or None
+        return time.strftime("%Y-%m-%d", fallback) if fallback else ""
+
+    @staticmethod
+    def _resolve_link(element: Any, link: str, base_url: str) -> str:
+        """Resolve *link* against the ``xml:base`` in scope and the feed URL.
+
+        Matches feedparser, which returns absolute entry links and drops
+        links it cannot parse (e.g. a malformed IPv6 host) rather than
+        failing the whole feed.
+        """
+        if not link:
+            return ""
         try:
-            feed = feedparser.parse(feed_url)
+            return urljoin(urljoin(base_url, element.base or ""), link)
+        except ValueError:
+            return ""
 
-            if hasattr(feed, "status") and feed.status != 200:
-                return articles
+    @staticmethod
+    def _has_markup(element: Any) -> bool:
+        """Return ``True`` if *element* holds child elements (inline markup)."""
+        return element is not None and len(element) > 0
 
-            if not hasattr(feed, "entries") or not feed.entries:
-                return articles
+    def _parse_rss_item(self, item: Any, base_url: str) -> dict | None:
+        """Extract an article dict from an RSS 2.0 ``<item>``.
 
-            for entry in feed.entries:
-                try:
-                    title = getattr(entry, "title", "") or ""
-                    summary = getattr(entry, "summary", "") or ""
-                    articles.append(
-                        {
-                            "date": self._extract_date(entry),
-                            "url": getattr(entry, "link", ""),
-                            "title": title,
-                            "summary": summary,
-                            "source": feed_url,
-                        }
-                    )
-                except Exception:
+        Returns ``None`` when the title or summary carries unescaped markup,
+        which feedparser keeps as HTML and is left to it.
+        """
+        title = item.find("title")
+        description = item.find("description")
+        content = item.find(_RSS_CONTENT)
+        for element in (title, description, content):
+            if self._has_markup(element):
+                return None
+
+        # Like feedparser, a permalink guid stands in only when there is
+        # no <link> at all, not when it is present but empty.
+        link_element = item.find("link")
+        link = self._xml_text(link_element)
+        if link_element is None:
+            guid = item.find("guid")
+            if guid is not None and guid.get("isPermaLink") != "false":
+                link_element = guid
+                link = self._xml_text(guid)
+
+        pub_date = self._xml_text(item.find("pubDate"))
+        date = self._format_date(pub_date, rfc822=True)
+        if not date:
+            date = self._format_date(
+                self._xml_text(item.find(_DC_DATE)), rfc822=False
+            )
+
+        return {
+            "date": date,
+            "url": self._resolve_link(link_element, link, base_url),
+            "title": self._xml_text(title),
+            "summary": self._xml_text(description) or self._xml_text(content),
+        }
+
+    def _parse_atom_entry(self, entry: Any, base_url: str) -> dict | None:
+        """Extract an article dict from an Atom ``<entry>``.
+
+        Returns ``None`` for XHTML text constructs and for text carrying
+        unescaped markup, which are left to feedparser.
+        """
+        title = entry.find(f"{_ATOM}title")
+        summary = entry.find(f"{_ATOM}summary")
+        if summary is None:
+            summary = entry.find(f"{_ATOM}content")
+        for element in (title, summary):
+            if element is not None and element.get("type") == "xhtml":
+                return None
+            if self._has_markup(element):
+                return None
+
+        link = ""
+        for candidate in entry.iterfind(f"{_ATOM}link"):
+            if candidate.get("rel", "alternate") == "alternate":
+                link = self._resolve_link(
+                    candidate, candidate.get("href", "").strip(), base_url
+                )
+                break
+
+        published = self._xml_text(entry.find(f"{_ATOM}published"))
+        updated = self._xml_text(entry.find(f"{_ATOM}updated"))
+
+        return {
+            "date": self._format_date(published or updated, rfc822=False),
+            "url": link,
+            "title": self._xml_text(title),
+            "summary": self._xml_text(summary),
+        }
+
+    def _parse_with_lxml(
+        self, content: bytes, base_url: str
+    ) -> list[dict] | None:
+        """Parse RSS 2.0 or Atom *content* with lxml (libxml2).
+
+        Entries are read incrementally with ``iterparse`` and cleared as
+        soon as they are converted, so the full document tree is never
+        held in memory.  Returns ``None`` when the document is not
+        something this fast path handles (malformed XML, RSS 1.0/RDF,
+        XHTML or inline markup in text), so the caller can fall back to
+        feedparser.
+        """
+        events = etree.iterparse(
+            io.BytesIO(content),
+            events=("end",),
+            tag=("item", f"{_ATOM}entry"),
+            recover=False,
+            resolve_entities=False,
+            no_network=True,
+        )
+        entries: list[dict] = []
+        try:
+            for _, element in events:
+                parent = element.getparent()
+                if parent is None:
                     continue
+                grandparent = parent.getparent()
+
+                if element.tag == "item":
+                    # RSS 2.0: rss/channel/item
+                    if parent.tag != "channel" or grandparent is None:
+                        continue
+                    if grandparent.tag != "rss":
+                        continue
+                    parsed = self._parse_rss_item(element, base_url)
+                else:
+                    # Atom: feed/entry
+                    if parent.tag != f"{_ATOM}feed" or grandparent is not None:
+                        continue
+                    parsed = self._parse_atom_entry(element, base_url)
+
+                if parsed is None:
+                    return None
+                entries.append(parsed)
+
+                # Release the converted entry and anything before it
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+        except etree.XMLSyntaxError:
+            return None
+
+        root = events.root
+        if root is None or root.tag not in ("rss", f"{_ATOM}feed"):
+            return None
+        return entries
+
+    # ------------------------------------------------------------------
+    # Helpers — feed fetching
+    # ------------------------------------------------------------------
+
+    def _parse_with_feedparser(
+        self, content: bytes, resp: requests.Response
+    ) -> list[dict]:
+        """Parse *content* with feedparser (slower, but handles any format)."""
+        # feedparser looks headers up by lower-case name (charset
+        # detection relies on ``content-type``).  Only raw title and
+        # summary text is used downstream, so the costly HTML
+        # sanitizer and relative-URI rewriting passes are skipped.
+        headers = {k.lower(): v for k, v in resp.headers.items()}
+        # Relative links resolve against the (final) feed URL, as they did
+        # when feedparser fetched the URL itself.
+        headers.setdefault("content-location", resp.url)
+        feed = feedparser.parse(
+            content,
+            response_headers=headers,
+            resolve_relative_uris=False,
+            sanitize_html=False,
+        )
+
+        # feedparser results and entries are dict subclasses; plain
+        # ``.get`` avoids the attribute-lookup fallbacks of getattr.
+        entries: list[dict] = []
+        for entry in feed.get("entries") or []:
+            try:
+                entries.append(
+                    {
+                        "date": self._extract_date(entry),
+                        "url": entry.get("link", ""),
+                        "title": entry.get("title") or "",
+                        "summary": entry.get("summary") or "",
+                    }
+                )
+            except Exception:
+                continue
+        return entries
+
+    @staticmethod
+    def _read_body(resp: requests.Response) -> bytes | None:
+        """Read a streamed response body, or ``None`` if it is too large."""
+        length = resp.headers.get("Content-Length", "")
+        if length.isdigit() and int(length) > _MAX_FEED_BYTES:
+            return None
+
+        body = bytearray()
+        for chunk in resp.iter_content(chunk_size=_CHUNK_SIZE):
+            body += chunk
+            if len(body) > _MAX_FEED_BYTES:
+                return None
+        return bytes(body)
+
+    def _parse_feed(self, feed_url: str) -> list[dict]:
+        """Parse a single feed and return a list of article dicts."""
+        try:
+            # Fetch with requests (bounded by a timeout) and hand only the
+            # bytes to feedparser, which would otherwise block on its own
+            # un-timed urlopen.
+            with SESSION.get(
+                feed_url,
+                timeout=_REQUEST_TIMEOUT,
+                headers={"User-Agent": self._USER_AGENT},
+                stream=True,
+            ) as resp:
+                if resp.status_code != 200:
+                    return []
+                content = self._read_body(resp)
+            if content is None:
+                return []
+
+            entries = self._parse_with_lxml(content, resp.url)
+            if entries is None:
+                entries = self._parse_with_feedparser(content, resp)
         except Exception:
-            pass
-        return articles
+            return []
+
+        return [{**entry, "source": feed_url} for entry in entries]
 
     # ------------------------------------------------------------------
     # BaseTool interface
@@ -131,21 +387,35 @@ class FeedReaderTool(BaseTool):
         all_articles: list[dict] = []
         total = len(valid_feeds)
 
-        for idx, url in enumerate(valid_feeds, 1):
-            domain = urlparse(url).netloc or url
-            print(
-                f"    \U0001f4e1 [{idx}/{total}] Reading {domain}",
-                file=sys.stderr,
-                flush=True,
-            )
-            all_articles.extend(self._parse_feed(url))
+        if valid_feeds:
+            workers = min(_MAX_WORKERS, total)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(self._parse_feed, url): url
+                    for url in valid_feeds
+                }
+                for idx, future in enumerate(as_completed(futures), 1):
+                    url = futures[future]
+                    domain = urlparse(url).netloc or url
+                    print(
+                        f"    \U0001f4e1 [{idx}/{total}] Read {domain}",
+                        file=sys.stderr,
+                        flush=True,
+                    )
+
+            # Collect in feed order so the output is deterministic
+            for future in futures:
+                try:
+                    all_articles.extend(future.result())
+                except Exception:
+                    continue
 
         # Pre-filter: only keep articles that pass the mandatory
         # REGION + PRIMARY/SECONDARY keyword gates.
         filtered: list[dict] = []
         for article in all_articles:
             text = f"{article.get('title', '')} {article.get('summary', '')}"
-            passes, matched = matches_keywords(text)
+            passes, matched = matches_keywords_lower(text.lower())
             if passes:
                 article["matched_keywords"] = matched
                 filtered.append(article)
@@ -157,4 +427,4 @@ class FeedReaderTool(BaseTool):
             flush=True,
         )
 
-        return json.dumps(filtered, ensure_ascii=False)
+        return orjson.dumps(filtered).decode()
@@ -2,17 +2,26 @@
 
 import json
 import sys
+import threading
 from typing import Any
 
+import orjson
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 
-from config import GOOGLE_API_KEY, GOOGLE_CSE_ID, matches_keywords
+from config import GOOGLE_API_KEY, GOOGLE_CSE_ID, matches_keywords_lower
 from tools.base import BaseTool
 
 
 class GoogleSearchTool(BaseTool):
     """Wraps the Google Custom Search API as an agent-callable tool."""
 
+    # The service is built once and shared; its HTTP transport (httplib2)
+    # is not thread-safe, so each thread executes requests on its own.
+    _service: Any = None
+    _service_lock = threading.Lock()
+    _local = threading.local()
+
     @property
     def name(self) -> str:
         return "google_search"
@@ -55,6 +64,40 @@ class GoogleSearchTool(BaseTool):
             },
         }
 
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def _get_service(cls) -> Any:
+        """Return the shared Custom Search service, building it once."""
+        if cls._service is None:
+            with cls._service_lock:
+                if cls._service is None:
+                    # The discovery document ships with
+                    # google-api-python-client, so building the service
+                    # needs no network round-trip.
+                    cls._service = build(
+                        "customsearch",
+                        "v1",
+                        developerKey=GOOGLE_API_KEY,
+                        static_discovery=True,
+                    )
+        return cls._service
+
+    @classmethod
+    def _get_http(cls) -> Any:
+        """Return this thread's HTTP transport for executing requests."""
+        http = getattr(cls._local, "http", None)
+        if http is None:
+            http = build_http()
+            cls._local.http = http
+        return http
+
+    # ------------------------------------------------------------------
+    # BaseTool interface
+    # ------------------------------------------------------------------
+
     def execute(self, **kwargs: Any) -> str:
         query: str = kwargs["query"]
         num_results: int = kwargs.get("num_results", 5)
@@ -67,16 +110,18 @@ class GoogleSearchTool(BaseTool):
         )
 
         try:
-            service = build(
-                "customsearch",
-                "v1",
-                developerKey=GOOGLE_API_KEY,
-                cache_discovery=False,
-            )
+            service = self._get_service()
             response = (
                 service.cse()
-                .list(q=query, cx=GOOGLE_CSE_ID, dateRestrict=date_restrict, num=num_results)
-                .execute()
+                .list(
+                    q=query,
+                    cx=GOOGLE_CSE_ID,
+                    dateRestrict=date_restrict,
+                    num=num_results,
+                    # Only the fields read below; trims the response payload
+                    fields="items(title,link,snippet)",
+                )
+                .execute(http=self._get_http())
             )
             items = response.get("items", [])
             results = [
@@ -93,12 +138,12 @@ class GoogleSearchTool(BaseTool):
             filtered: list[dict] = []
             for result in results:
                 text = f"{result.get('title', '')} {result.get('snippet', '')}"
-                passes, matched = matches_keywords(text)
+                passes, matched = matches_keywords_lower(text.lower())
                 if passes:
                     result["matched_keywords"] = matched
                     filtered.append(result)
 
-            return json.dumps(filtered, ensure_ascii=False)
+            return orjson.dumps(filtered).decode()
         except Exception as exc:
             print(
                 f"    \u26a0 Search error: {exc}",
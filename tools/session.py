@@ -0,0 +1,56 @@
+"""HTTP session shared by the feed reader and web scraper tools.
+
+One pooled, retrying session keeps connections alive across both tools
+and caches responses on disk, so a recent run's feeds and pages are
+revalidated via ETag/Last-Modified rather than downloaded again.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+from config import HTTP_CACHE_EXPIRE, HTTP_CACHE_PATH
+
+# Storing a response reads its whole body up front, which would bypass the
+# tools' streaming size caps; only bodies declared at most this large are
+# cached (the scraper's page cap, the smaller of the two).
+MAX_CACHED_BYTES = 2 * 1024 * 1024
+
+
+def _is_cacheable(response: requests.Response) -> bool:
+    """Cache only unencoded responses declared within the size cap.
+
+    Responses without a Content-Length (chunked) cannot be sized before
+    reading, and for gzip/deflate bodies it is the compressed size, which
+    says nothing about what the cache would inflate and store; both are
+    left to stream uncached.
+    """
+    encoding = response.headers.get("Content-Encoding", "identity")
+    if encoding.strip().lower() not in ("", "identity"):
+        return False
+    length = response.headers.get("Content-Length", "")
+    return length.isdigit() and int(length) <= MAX_CACHED_BYTES
+
+
+# Transient gateway errors are retried; the final response is still
+# returned so callers can report its status code.
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[502, 504],
+        raise_on_status=False,
+    ),
+)
+
+SESSION = CachedSession(
+    HTTP_CACHE_PATH,
+    backend="sqlite",
+    expire_after=HTTP_CACHE_EXPIRE,
+    filter_fn=_is_cacheable,
+)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
@@ -10,23 +10,29 @@ inaccessible are skipped and reported in the output so the agent is always
 aware of what could not be reached.
 """
 
-import json
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
+import lxml.html
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 
-from config import SCRAPE_URLS, matches_keywords
+from config import SCRAPE_URLS, matches_keywords_lower
 from tools.base import BaseTool
+from tools.session import SESSION
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 _REQUEST_TIMEOUT = 15  # seconds
 _MAX_ENTRIES_PER_URL = 200  # safety cap for very large pages
+_MAX_WORKERS = 16  # pages fetched concurrently
+_MAX_PAGE_BYTES = 2 * 1024 * 1024  # larger pages are truncated
+_CHUNK_SIZE = 64 * 1024
 
 _USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -48,7 +54,33 @@ _CAPTCHA_PATTERNS = re.compile(
 
 # Tags that typically wrap meaningful link entries on listing pages
 _ENTRY_TAGS = ["a"]
-_CONTAINER_TAGS = ["article", "li", "div", "tr", "section", "h1", "h2", "h3", "h4"]
+_CONTAINER_TAGS = frozenset(
+    {"article", "li", "div", "tr", "section", "h1", "h2", "h3", "h4"}
+)
+
+# Link targets that never point to a distinct page
+_BAD_HREF_PREFIXES = ("#", "javascript:", "mailto:", "tel:", "data:")
+
+# Elements whose text is not rendered as page content
+_NON_TEXT_TAGS = frozenset({"script", "style", "template", "rp", "rt"})
+
+# Compiled once: every anchor with an href, the nearest container above an
+# anchor, and the visible text nodes below an element.
+_XP_ANCHORS = etree.XPath("//a[@href]")
+_XP_CONTAINER = etree.XPath(
+    "ancestor::*[{}][1]".format(
+        " or ".join(f"self::{tag}" for tag in sorted(_CONTAINER_TAGS))
+    )
+)
+_XP_TEXT = etree.XPath(
+    ".//text()[not(ancestor::*[{}])]".format(
+        " or ".join(f"self::{tag}" for tag in sorted(_NON_TEXT_TAGS))
+    )
+)
+
+# Pages are decoded by requests; re-encode as UTF-8 and say so, which also
+# sidesteps lxml's refusal of str input carrying an XML declaration.
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
 
 
 class WebScraperTool(BaseTool):
@@ -111,16 +143,35 @@ class WebScraperTool(BaseTool):
         except Exception:
             return False
 
+    @staticmethod
+    def _read_text(resp: requests.Response) -> str:
+        """Read at most ``_MAX_PAGE_BYTES`` of a streamed *resp* as text.
+
+        Oversized pages are truncated rather than skipped: listing entries
+        sit near the top, and lxml recovers from the cut-off markup.
+        """
+        body = bytearray()
+        for chunk in resp.iter_content(chunk_size=_CHUNK_SIZE):
+            body += chunk
+            if len(body) >= _MAX_PAGE_BYTES:
+                del body[_MAX_PAGE_BYTES:]
+                break
+        try:
+            return body.decode(resp.encoding or "utf-8", errors="replace")
+        except LookupError:  # unknown charset label
+            return body.decode("utf-8", errors="replace")
+
     def _fetch_page(self, url: str) -> tuple[str | None, str | None]:
         """Fetch *url* and return ``(html, None)`` on success or
         ``(None, reason)`` when the page must be skipped.
         """
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 url,
                 timeout=_REQUEST_TIMEOUT,
                 headers={"User-Agent": _USER_AGENT},
                 allow_redirects=True,
+                stream=True,
             )
         except requests.exceptions.SSLError:
             return None, "SSL certificate error"
@@ -133,29 +184,39 @@ class WebScraperTool(BaseTool):
         except requests.exceptions.RequestException as exc:
             return None, f"Request error: {exc}"
 
-        # Check for auth-related status codes
-        if resp.status_code in _AUTH_STATUS_CODES:
-            return None, f"HTTP {resp.status_code} — authentication or access denied"
+        # Streamed: the body is only read once the checks below pass
+        with resp:
+            # Check for auth-related status codes
+            if resp.status_code in _AUTH_STATUS_CODES:
+                return None, (
+                    f"HTTP {resp.status_code} — authentication or access denied"
+                )
 
-        # Check for rate-limit / challenge status codes
-        if resp.status_code in _CHALLENGE_STATUS_CODES:
-            return None, (
-                f"HTTP {resp.status_code} — rate-limited or anti-bot challenge"
-            )
+            # Check for rate-limit / challenge status codes
+            if resp.status_code in _CHALLENGE_STATUS_CODES:
+                return None, (
+                    f"HTTP {resp.status_code} — rate-limited or anti-bot challenge"
+                )
 
-        # Any other non-2xx response
-        if not resp.ok:
-            return None, f"HTTP {resp.status_code}"
+            # Any other non-2xx response
+            if not resp.ok:
+                return None, f"HTTP {resp.status_code}"
 
-        # Verify we received HTML content (not PDF, image, etc.)
-        content_type = resp.headers.get("Content-Type", "")
-        if "text/html" not in content_type and "application/xhtml" not in content_type:
-            return None, f"Non-HTML content type: {content_type}"
+            # Verify we received HTML content (not PDF, image, etc.)
+            content_type = resp.headers.get("Content-Type", "")
+            if (
+                "text/html" not in content_type
+                and "application/xhtml" not in content_type
+            ):
+                return None, f"Non-HTML content type: {content_type}"
 
-        html = resp.text
+            try:
+                html = self._read_text(resp)
+            except requests.exceptions.RequestException as exc:
+                return None, f"Request error: {exc}"
 
         # Detect CAPTCHA / anti-bot challenge pages
-        if _CAPTCHA_PATTERNS.search(html[:5000]):
+        if _CAPTCHA_PATTERNS.search(html, 0, 5000):
             return None, "Page contains a CAPTCHA or anti-bot challenge"
 
         return html, None
@@ -165,9 +226,11 @@ class WebScraperTool(BaseTool):
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _visible_text(tag: Any) -> str:
-        """Extract human-readable text from a BS4 tag, collapsing whitespace."""
-        return " ".join(tag.stripped_strings)
+    def _visible_text(element: Any) -> str:
+        """Return the visible text of an lxml element, whitespace-collapsed."""
+        return " ".join(
+            text for text in (node.strip() for node in _XP_TEXT(element)) if text
+        )
 
     def _extract_entries(self, html: str, base_url: str) -> list[dict]:
         """Parse *html* and return a list of ``{url, text}`` dicts.
@@ -176,14 +239,24 @@ class WebScraperTool(BaseTool):
         to a distinct page (not anchors, javascript:, mailto:, etc.) and
         collect the surrounding text from the nearest container element.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        try:
+            tree = lxml.html.fromstring(html.encode("utf-8"), parser=_HTML_PARSER)
+        except etree.ParserError:
+            return []
+
         entries: list[dict] = []
+        seen_hrefs: set[str] = set()
         seen_urls: set[str] = set()
 
-        for anchor in soup.find_all("a", href=True):
-            href = anchor["href"].strip()
-            if not href or href.startswith(("#", "javascript:", "mailto:")):
+        for anchor in _XP_ANCHORS(tree):
+            href = anchor.get("href", "").strip()
+            if not href or href.startswith(_BAD_HREF_PREFIXES):
+                continue
+
+            # Repeated raw hrefs are skipped before paying for urljoin
+            if href in seen_hrefs:
                 continue
+            seen_hrefs.add(href)
 
             absolute_url = urljoin(base_url, href)
 
@@ -192,14 +265,11 @@ class WebScraperTool(BaseTool):
                 continue
             seen_urls.add(absolute_url)
 
-            # Gather context text: look up to the nearest container parent
-            context_tag = anchor
-            for parent in anchor.parents:
-                if parent.name in _CONTAINER_TAGS:
-                    context_tag = parent
-                    break
+            # Gather context text from the nearest container ancestor
+            containers = _XP_CONTAINER(anchor)
+            context = containers[0] if containers else anchor
 
-            text = self._visible_text(context_tag)
+            text = self._visible_text(context)
             if not text:
                 text = self._visible_text(anchor)
 
@@ -226,7 +296,7 @@ class WebScraperTool(BaseTool):
         """
         filtered: list[dict] = []
         for entry in entries:
-            passes, matched = matches_keywords(entry["text"])
+            passes, matched = matches_keywords_lower(entry["text"].lower())
             if passes:
                 filtered.append(
                     {
@@ -243,6 +313,21 @@ class WebScraperTool(BaseTool):
     # BaseTool.execute
     # ------------------------------------------------------------------
 
+    def _scrape_page(self, url: str) -> tuple[list[dict], str | None]:
+        """Scrape a single page and return ``(entries, skip_reason)``."""
+        # Validate URL structure
+        if not self._validate_url(url):
+            return [], "Invalid URL format"
+
+        # Fetch the page
+        html, skip_reason = self._fetch_page(url)
+        if skip_reason:
+            return [], skip_reason
+
+        # Extract and filter entries
+        entries = self._extract_entries(html, url)  # type: ignore[arg-type]
+        return self._filter_entries(entries, url), None
+
     def execute(self, **kwargs: Any) -> str:
         urls: list[str] = kwargs.get("urls") or list(SCRAPE_URLS)
 
@@ -250,34 +335,36 @@ class WebScraperTool(BaseTool):
         skipped: list[dict] = []
         total = len(urls)
 
-        for idx, url in enumerate(urls, 1):
-            domain = urlparse(url).netloc or url
-            print(
-                f"    \U0001f310 [{idx}/{total}] Scraping {domain}",
-                file=sys.stderr,
-                flush=True,
-            )
-
-            # Validate URL structure
-            if not self._validate_url(url):
-                skipped.append({"url": url, "reason": "Invalid URL format"})
-                continue
-
-            # Fetch the page
-            html, skip_reason = self._fetch_page(url)
-            if skip_reason:
-                print(
-                    f"      \u26a0 Skipped: {skip_reason}",
-                    file=sys.stderr,
-                    flush=True,
-                )
-                skipped.append({"url": url, "reason": skip_reason})
-                continue
-
-            # Extract and filter entries
-            entries = self._extract_entries(html, url)  # type: ignore[arg-type]
-            filtered = self._filter_entries(entries, url)
-            results.extend(filtered)
+        if urls:
+            # Pages are independent network round-trips; fetch them
+            # concurrently and report progress as each one finishes.
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_WORKERS, total)
+            ) as pool:
+                futures = {pool.submit(self._scrape_page, url): url for url in urls}
+                for idx, future in enumerate(as_completed(futures), 1):
+                    url = futures[future]
+                    domain = urlparse(url).netloc or url
+                    print(
+                        f"    \U0001f310 [{idx}/{total}] Scraped {domain}",
+                        file=sys.stderr,
+                        flush=True,
+                    )
+                    _, skip_reason = future.result()
+                    if skip_reason:
+                        print(
+                            f"      \u26a0 Skipped: {skip_reason}",
+                            file=sys.stderr,
+                            flush=True,
+                        )
+
+            # Collect in input order so the output is deterministic
+            for future, url in futures.items():
+                filtered, skip_reason = future.result()
+                if skip_reason:
+                    skipped.append({"url": url, "reason": skip_reason})
+                    continue
+                results.extend(filtered)
 
         print(
             f"    \U0001f4cb {len(results)} entries kept, {len(skipped)} pages skipped",
@@ -285,7 +372,4 @@ class WebScraperTool(BaseTool):
             flush=True,
         )
 
-        return json.dumps(
-            {"results": results, "skipped": skipped},
-            ensure_ascii=False,
-        )
+        return orjson.dumps({"results": results, "skipped": skipped}).decode()